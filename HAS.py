@@ -1,19 +1,145 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser
 import heapq
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, date
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from functools import lru_cache
+from itertools import count, islice
 import json
 import os
 import random
 import re
 import sys
+import threading
+import uuid
 import numpy as np
-import pandas as pd
+import orjson
 
-# Ensure matplotlib backend is set correctly
-plt.switch_backend('TkAgg')
+# ---------------------------
+# JSON Persistence Helpers
+# ---------------------------
+def load_json(raw):
+    """Parse JSON bytes with orjson, falling back to the stdlib parser for
+    documents orjson rejects (e.g. NaN/Infinity written by older versions)."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+def parse_timestamp(value):
+    """Turn a stored timestamp back into a datetime.
+
+    Timestamps are stored as epoch seconds; ISO 8601 / '%Y-%m-%d %H:%M:%S'
+    strings written by older versions are still accepted."""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    return datetime.fromisoformat(value)
+
+def write_file_atomic(path, data):
+    """Atomically replace path with data (bytes).
+
+    The data goes to a temporary sibling file first, so a crash mid-write
+    never leaves a truncated file behind."""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb', buffering=1 << 20) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+class AsyncWriter:
+    """Writes files on a background thread so disk I/O never blocks the Tk event loop.
+
+    Callers hand over bytes serialized on the Tk thread, so each write is a
+    consistent snapshot and no data is shared with the thread. When several
+    writes to the same path are waiting, only the newest one is written."""
+    def __init__(self):
+        self._pending = {}  # path -> (data, on_error)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closing = False
+        self._errors = deque()  # (on_error, exception) of failed writes, reported on the Tk thread
+        self._thread = threading.Thread(target=self._run, name="AsyncWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, data, on_error=None):
+        with self._lock:
+            self._pending[path] = (data, on_error)
+        self._wake.set()
+
+    def report_errors(self):
+        """Pass each failed write's exception to its on_error handler. Call from the Tk thread."""
+        while self._errors:
+            on_error, error = self._errors.popleft()
+            if on_error is not None:
+                on_error(error)
+
+    def close(self):
+        """Write everything still pending, stop the thread and report any failures."""
+        with self._lock:
+            self._closing = True
+        self._wake.set()
+        self._thread.join()
+        self.report_errors()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            with self._lock:
+                self._wake.clear()
+                pending, self._pending = self._pending, {}
+                closing = self._closing
+            for path, (data, on_error) in pending.items():
+                try:
+                    write_file_atomic(path, data)
+                except Exception as e:
+                    self._errors.append((on_error, e))
+            if closing:
+                return
+
+class DebouncedSaver:
+    """Coalesces bursts of save requests into a single write scheduled on the Tk event loop.
+
+    Until a Tk root is attached every request is written immediately, and
+    until an AsyncWriter is attached files are written on the calling thread."""
+    def __init__(self, save_func, delay_ms=500):
+        self.save_func = save_func
+        self.delay_ms = delay_ms
+        self.root = None
+        self.writer = None
+        self._dirty = False
+        self._save_job = None
+
+    def schedule(self):
+        """Mark the data dirty and arrange for it to be written within delay_ms."""
+        self._dirty = True
+        if self.root is None:
+            self.flush()
+        elif self._save_job is None:
+            self._save_job = self.root.after(self.delay_ms, self._on_timer)
+
+    def _on_timer(self):
+        self._save_job = None
+        self.flush()
+
+    def flush(self):
+        """Write now if anything is pending."""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        if self._dirty:
+            self._dirty = False
+            self.save_func()
+
+    def write(self, path, data, on_error=None):
+        """Atomically write data (bytes) to path.
+
+        With a writer attached this returns at once and a failure is passed to
+        on_error later, on the Tk thread; without one, failures raise here."""
+        if self.writer is None:
+            write_file_atomic(path, data)
+            return
+        self.writer.submit(path, data, on_error)
+        self.root.after(self.delay_ms, self.writer.report_errors)
 
 # Custom style configuration
 class CustomStyle:
@@ -26,110 +152,195 @@ class CustomStyle:
         self.success_color = "#27ae60"
         self.warning_color = "#f39c12"
         self.error_color = "#e74c3c"
-        
-        # Configure ttk styles
-        style = ttk.Style()
-        style.configure("TFrame", background=self.bg_color)
-        style.configure("TLabel", background=self.bg_color, foreground=self.text_color, font=("Segoe UI", 10))
-        style.configure("TButton", 
-                       background=self.secondary_color,
-                       foreground="Black",
-                       font=("Segoe UI", 10, "bold"),
-                       padding=5)
-        style.map("TButton",
-                 background=[("active", self.primary_color)],
-                 foreground=[("active", "white")])
-        style.configure("Header.TLabel", 
-                       font=("Segoe UI", 24, "bold"),
-                       foreground=self.primary_color)
-        style.configure("Subheader.TLabel",
-                       font=("Segoe UI", 16),
-                       foreground=self.secondary_color)
-        style.configure("Success.TButton",
-                       background=self.success_color)
-        style.configure("Warning.TButton",
-                       background=self.warning_color)
-        style.configure("Error.TButton",
-                       background=self.error_color)
-        style.configure("TEntry",
-                       fieldbackground="white",
-                       padding=5)
-        style.configure("TCombobox",
-                       fieldbackground="white",
-                       padding=5)
-        style.configure("Treeview",
-                       background="white",
-                       fieldbackground="white",
-                       foreground=self.text_color)
-        style.configure("Treeview.Heading",
-                       background=self.primary_color,
-                       foreground="black",
-                       font=("Segoe UI", 10, "bold"))
-        style.map("Treeview",
-                 background=[("selected", self.secondary_color)],
-                 foreground=[("selected", "white")])
+
+def configure_styles(palette):
+    """Register every ttk style the app uses, from a CustomStyle palette.
+
+    ttk styles are process-global, so the Tcl calls only happen on the first call."""
+    if configure_styles._done:
+        return
+    configure_styles._done = True
+    style = ttk.Style()
+    style.configure("TFrame", background=palette.bg_color)
+    # Page backgrounds come from these styles rather than per-widget options
+    style.configure("Page.TFrame", background=palette.bg_color)
+    style.configure("Home.TFrame", background="#f7fafd")
+    style.configure("TLabel", background=palette.bg_color, foreground=palette.text_color, font=("Segoe UI", 10))
+    style.configure("TButton", 
+                   background=palette.secondary_color,
+                   foreground="Black",
+                   font=("Segoe UI", 10, "bold"),
+                   padding=5)
+    # Hover feedback comes from ttk's built-in 'active' state, so no per-button bindings are needed
+    style.map("TButton",
+             background=[("active", palette.primary_color)],
+             foreground=[("active", "white")],
+             relief=[("pressed", "sunken"), ("active", "raised")])
+    style.configure("Modern.TButton",
+                   font=("Segoe UI", 11, "bold"),
+                   background="#ffffff",
+                   foreground="#000000",
+                   padding=8,
+                   borderwidth=0)
+    style.map("Modern.TButton",
+             background=[("active", "#e3e8ee")],
+             foreground=[("active", "#000000")])
+    style.configure("Header.TLabel", 
+                   font=("Segoe UI", 24, "bold"),
+                   foreground=palette.primary_color)
+    style.configure("Subheader.TLabel",
+                   font=("Segoe UI", 16),
+                   foreground=palette.secondary_color)
+    style.configure("Success.TButton",
+                   background=palette.success_color)
+    style.map("Success.TButton",
+             background=[("active", "#219a52")])
+    style.configure("Warning.TButton",
+                   background=palette.warning_color)
+    style.map("Warning.TButton",
+             background=[("active", "#d68910")])
+    style.configure("Error.TButton",
+                   background=palette.error_color)
+    style.map("Error.TButton",
+             background=[("active", "#c0392b")])
+    style.configure("TEntry",
+                   fieldbackground="white",
+                   padding=5)
+    style.configure("TCombobox",
+                   fieldbackground="white",
+                   padding=5)
+    style.configure("Treeview",
+                   background="white",
+                   fieldbackground="white",
+                   foreground=palette.text_color)
+    style.configure("Treeview.Heading",
+                   background=palette.primary_color,
+                   foreground="black",
+                   font=("Segoe UI", 10, "bold"))
+    style.map("Treeview",
+             background=[("selected", palette.secondary_color)],
+             foreground=[("selected", "white")])
+    style.configure("Dept.Treeview", foreground="black", font=("Segoe UI", 10))
+    style.configure("Dept.Treeview.Heading", foreground="black", font=("Segoe UI", 10, "bold"))
+
+configure_styles._done = False
 
 # ---------------------------
 # Core Scheduling Logic
 # ---------------------------
+@dataclass(slots=True)
+class ServedPatient:
+    name: str
+    severity: int
+    department: str
+    timestamp: datetime
+
 class HospitalScheduler:
+    # Severities are bounded (1 = most urgent), so the waiting queue is a bucket
+    # queue: one FIFO deque per severity level, giving O(1) add and serve.
+    MAX_SEVERITY = 10
+
     def __init__(self):
-        self.pq = []  # Priority Queue (Min-Heap) for waiting patients
-        self.counter = 0  # Used for tie-breaking
+        self.buckets = [deque() for _ in range(self.MAX_SEVERITY + 1)]  # Index 0 unused
+        self.size = 0  # Number of waiting patients
+        self._active_keys = set()  # (name, department) of every waiting patient
+        self._waiting_snapshot = None  # Cached get_waiting_list() result; None once the queue changes
         self.served_patients = []  # List to store served patient records
         self.appointment_file = 'appointments_today.json'
+        self.saver = DebouncedSaver(self.save_appointments)
         self.load_appointments()
 
     def load_appointments(self):
         today_str = date.today().isoformat()
         try:
-            with open(self.appointment_file, 'r') as f:
-                data = json.load(f)
+            with open(self.appointment_file, 'rb') as f:
+                raw = f.read()
+            # 'date' is the first key written, so a file from another day is
+            # recognised from its first bytes and never parsed in full
+            if today_str.encode() in raw[:64]:
+                data = load_json(raw)
                 if data.get('date') == today_str:
-                    self.pq = [tuple(item) for item in data.get('waiting', [])]
-                    self.counter = data.get('counter', 0)
-                    self.served_patients = [(n, s, d, datetime.strptime(t, '%Y-%m-%d %H:%M:%S')) for n, s, d, t in data.get('served', [])]
+                    waiting = data.get('waiting', [])
+                    if waiting and len(waiting[0]) == 4:
+                        # Older files stored the raw heap array, with an arrival counter after
+                        # the severity; sort by it so each bucket is restored in FIFO order
+                        waiting = sorted(waiting, key=lambda item: (item[0], item[1]))
+                    for item in waiting:
+                        severity, name, department = item[0], item[-2], item[-1]
+                        if not isinstance(severity, int) or not 1 <= severity <= self.MAX_SEVERITY:
+                            continue  # Skip entries with no valid bucket rather than misfiling them
+                        self.buckets[severity].append((name, department))
+                        self._active_keys.add((name, department))
+                        self.size += 1
+                    self._waiting_snapshot = None
+                    self.served_patients = [ServedPatient(n, s, d, parse_timestamp(t)) for n, s, d, t in data.get('served', [])]
                     return
         except Exception:
             pass
         # If not today or file missing/corrupt, reset
-        self.pq = []
-        self.counter = 0
+        self.clear()
+
+    def clear(self):
+        """Drop every waiting and served appointment."""
+        for bucket in self.buckets:
+            bucket.clear()
+        self.size = 0
+        self._active_keys.clear()
+        self._waiting_snapshot = None
         self.served_patients = []
-        self.save_appointments()
+        self.saver.schedule()
 
     def save_appointments(self):
         today_str = date.today().isoformat()
         try:
-            with open(self.appointment_file, 'w') as f:
-                json.dump({
-                    'date': today_str,
-                    'waiting': self.pq,
-                    'counter': self.counter,
-                    'served': [(n, s, d, t.strftime('%Y-%m-%d %H:%M:%S')) for n, s, d, t in self.served_patients]
-                }, f)
+            self.saver.write(self.appointment_file, orjson.dumps({
+                'date': today_str,
+                'waiting': self.get_waiting_list(),
+                'served': [(p.name, p.severity, p.department, p.timestamp.timestamp()) for p in self.served_patients]
+            }))
         except Exception:
             pass
 
     def add_patient(self, name, severity, department):
-        heapq.heappush(self.pq, (severity, self.counter, name, department))
-        self.counter += 1
-        self.save_appointments()
+        if not 1 <= severity <= self.MAX_SEVERITY:
+            raise ValueError(f"Severity must be between 1 and {self.MAX_SEVERITY}")
+        self.buckets[severity].append((name, department))
+        self._active_keys.add((name, department))
+        self.size += 1
+        self._waiting_snapshot = None
+        self.saver.schedule()
 
     def serve_patient(self):
-        if self.pq:
-            severity, _, name, department = heapq.heappop(self.pq)
+        for severity in range(1, self.MAX_SEVERITY + 1):
+            bucket = self.buckets[severity]
+            if not bucket:
+                continue
+            name, department = bucket.popleft()
+            self._active_keys.discard((name, department))
+            self.size -= 1
+            self._waiting_snapshot = None
             timestamp = datetime.now()
-            self.served_patients.append((name, severity, department, timestamp))
+            self.served_patients.append(ServedPatient(name, severity, department, timestamp))
             # Decrement analytics severity count
             if hasattr(self, 'analytics') and self.analytics:
                 self.analytics.serve_patient_severity(severity)
-            self.save_appointments()
+            self.saver.schedule()
             return f"Serving: {name} (Severity: {severity}, Department: {department})"
         return "No patients in queue."
 
+    def is_waiting(self, name, department):
+        """Return True if name already has a waiting appointment in department."""
+        return (name, department) in self._active_keys
+
     def get_waiting_list(self):
-        return sorted(self.pq)
+        """Return every waiting patient as (severity, name, department), in priority order.
+
+        The list is cached until the queue next changes, so callers must not modify it."""
+        if self._waiting_snapshot is None:
+            self._waiting_snapshot = [(severity, name, department)
+                                      for severity in range(1, self.MAX_SEVERITY + 1)
+                                      for name, department in self.buckets[severity]]
+        return self._waiting_snapshot
 
     def get_served_list(self):
         return self.served_patients
@@ -137,63 +348,117 @@ class HospitalScheduler:
 # ---------------------------
 # Patient Management Using a Text File (JSON)
 # ---------------------------
+_CONTACT_RE = re.compile(r"[679]\d{9}")
+_GENDERS = frozenset({"male", "female"})
+_BLOOD_TYPES = frozenset({"a+", "a-", "b+", "b-", "ab+", "ab-", "o+", "o-"})
+
+@lru_cache(maxsize=1024)
+def _validate_fields(gender, contact, blood_type):
+    """ Returns the validation error message for these field values, or None if they are valid. """
+    if gender.lower() not in _GENDERS:
+        return "Gender must be 'Male' or 'Female'."
+    if not _CONTACT_RE.fullmatch(contact):
+        return "Contact must be 10 digits & start with 6 or 9."
+    if blood_type.lower() not in _BLOOD_TYPES:
+        return "Blood Group must be 'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'."
+    return None
 
 class PatientDatabase:
     def __init__(self):
         self.file = "patients.txt"
         self.patients = []
+        self._index = {}  # (Name, Contact, Age) -> position in self.patients
+        self._positions = {}  # ID -> position in self.patients
+        self.saver = DebouncedSaver(self.save_patients)
         self.load_patients()
 
+    @staticmethod
+    def patient_key(name, contact, age):
+        """Identity used for duplicate checks (stringified, so an age of 30 matches "30")."""
+        return (str(name), str(contact), str(age))
+
+    def _rebuild_index(self):
+        self._index = {
+            self.patient_key(p.get('Name'), p.get('Contact'), p.get('Age')): i
+            for i, p in enumerate(self.patients)
+        }
+        self._positions = {p['ID']: i for i, p in enumerate(self.patients)}
+
     def load_patients(self):
         if os.path.exists(self.file):
             try:
-                with open(self.file, "r") as f:
-                    self.patients = json.load(f)
+                with open(self.file, "rb") as f:
+                    self.patients = load_json(f.read())
             except Exception as e:
                 messagebox.showerror("Load Error", f"Error loading patient data: {e}")
                 self.patients = []
         else:
             self.patients = []
+        # Patients saved before IDs existed get one now so every row has a stable key
+        missing_ids = False
+        for patient in self.patients:
+            if 'ID' not in patient:
+                patient['ID'] = uuid.uuid4().hex
+                missing_ids = True
+        self._rebuild_index()
+        if missing_ids:
+            self.saver.schedule()
 
     def save_patients(self):
         try:
-            with open(self.file, "w") as f:
-                json.dump(self.patients, f, indent=4)
+            self.saver.write(self.file, orjson.dumps(self.patients), self.report_save_error)
         except Exception as e:
-            messagebox.showerror("Save Error", f"Error saving patient data: {e}")
+            self.report_save_error(e)
 
-    def validate_patient(self, patient):
-        """ Validates gender and contact number before adding. """
-        if patient["Gender"] not in ["Male", "Female","male","female","MALE","FEMALE"]:
-            messagebox.showerror("Validation Error", "Gender must be 'Male' or 'Female'.")
-            return False
+    def report_save_error(self, error):
+        messagebox.showerror("Save Error", f"Error saving patient data: {error}")
 
-        if not re.fullmatch(r"[679]\d{9}", patient["Contact"]):
-            messagebox.showerror("Validation Error", "Contact must be 10 digits & start with 6 or 9.")
-            return False
-        if patient["Blood Type"] not in ["A+", "A-","B+","B-","AB+","AB-","O+","O-","a+","a-","b+","b-","ab+","ab-","o+","o-"]:
-            messagebox.showerror("Validation Error", "Blood Group must be 'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'.")
+    def validate_patient(self, patient):
+        """ Validates gender, contact number and blood type before adding. """
+        error = _validate_fields(patient["Gender"], patient["Contact"], patient["Blood Type"])
+        if error:
+            messagebox.showerror("Validation Error", error)
             return False
-
         return True
 
     def add_patient(self, patient):
         """ Adds a patient after validation. Returns True if added, False if not. """
         if self.validate_patient(patient):
-            # Check for duplicate by Name and Contact
-            for p in self.patients:
-                if p.get('Name') == patient.get('Name') and  p.get('Age')==patient.get('Age') and p.get('Contact') == patient.get('Contact'):
-                    messagebox.showerror("Duplicate Error", "A patient with the same name and contact already exists.")
-                    return False
+            # Check for duplicate by Name, Contact and Age
+            key = self.patient_key(patient.get('Name'), patient.get('Contact'), patient.get('Age'))
+            if key in self._index:
+                messagebox.showerror("Duplicate Error", "A patient with the same name and contact already exists.")
+                return False
+            patient['ID'] = uuid.uuid4().hex
+            self._index[key] = len(self.patients)
+            self._positions[patient['ID']] = len(self.patients)
             self.patients.append(patient)
-            self.save_patients()
+            self.saver.schedule()
             return True
         return False
 
-    def delete_patient(self, patient_name):
-        """ Deletes a patient by name. """
-        self.patients = [p for p in self.patients if p["Name"] != patient_name]
-        self.save_patients()
+    def delete_patient_by_id(self, patient_id):
+        """ Deletes the patient with the given ID. Returns True if one was removed. """
+        idx = self._positions.pop(patient_id, None)
+        if idx is None:
+            return False
+        # Legacy records can share a key (e.g. ages 30 and "30"); the index then
+        # points at only one of them, so only touch entries that point here
+        removed = self.patients[idx]
+        removed_key = self.patient_key(removed.get('Name'), removed.get('Contact'), removed.get('Age'))
+        if self._index.get(removed_key) == idx:
+            del self._index[removed_key]
+        # Swap the last patient into the freed slot so only its index entries change
+        last = self.patients.pop()
+        last_idx = len(self.patients)
+        if idx < last_idx:
+            self.patients[idx] = last
+            last_key = self.patient_key(last.get('Name'), last.get('Contact'), last.get('Age'))
+            if self._index.get(last_key) == last_idx:
+                self._index[last_key] = idx
+            self._positions[last['ID']] = idx
+        self.saver.schedule()
+        return True
 
     def get_all_patients(self):
         """ Returns all stored patients. """
@@ -201,6 +466,8 @@ class PatientDatabase:
 
 
 class Department:
+    __slots__ = ('name', 'capacity', 'current_patients', 'staff')
+
     def __init__(self, name, capacity):
         self.name = name
         self.capacity = capacity
@@ -217,14 +484,21 @@ class DepartmentManager:
             "General Medicine": Department("General Medicine", 40),
             "Addiction control":Department("Addiction control",100)
         }
+        self.saver = DebouncedSaver(self.save_departments)
+        self._status_cache = None  # get_department_status() result; None once anything changes
+        self._display_cache = {}  # (current_patients, capacity) -> "X (Y.Y%)"; entries never go stale
         self.load_departments()
 
+    def _changed(self):
+        self._status_cache = None
+        self.saver.schedule()
+
     def load_departments(self):
         """Load departments from file if exists"""
         if os.path.exists('departments.json'):
             try:
-                with open('departments.json', 'r') as f:
-                    dept_data = json.load(f)
+                with open('departments.json', 'rb') as f:
+                    dept_data = load_json(f.read())
                     self.departments = {
                         name: Department(name, data['capacity'])
                         for name, data in dept_data.items()
@@ -234,6 +508,7 @@ class DepartmentManager:
                         self.departments[name].current_patients = data['current_patients']
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load departments: {e}")
+        self._status_cache = None
 
     def save_departments(self):
         """Save departments to file"""
@@ -245,17 +520,19 @@ class DepartmentManager:
                 }
                 for name, dept in self.departments.items()
             }
-            with open('departments.json', 'w') as f:
-                json.dump(dept_data, f, indent=4)
+            self.saver.write('departments.json', orjson.dumps(dept_data), self.report_save_error)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save departments: {e}")
+            self.report_save_error(e)
+
+    def report_save_error(self, error):
+        messagebox.showerror("Error", f"Failed to save departments: {error}")
 
     def add_department(self, name, capacity):
         """Add a new department"""
         if name in self.departments:
             raise ValueError("Department already exists")
         self.departments[name] = Department(name, capacity)
-        self.save_departments()
+        self._changed()
 
     def delete_department(self, name):
         """Delete a department"""
@@ -264,7 +541,7 @@ class DepartmentManager:
         if self.departments[name].current_patients > 0:
             raise ValueError("Cannot delete department with active patients")
         del self.departments[name]
-        self.save_departments()
+        self._changed()
 
     def update_department(self, name, capacity=None):
         """Update department details"""
@@ -274,7 +551,7 @@ class DepartmentManager:
             if capacity < self.departments[name].current_patients:
                 raise ValueError("New capacity cannot be less than current patients")
             self.departments[name].capacity = capacity
-        self.save_departments()
+        self._changed()
 
     def admit_patient(self, department_name):
         """Admit a patient to a department"""
@@ -284,7 +561,7 @@ class DepartmentManager:
         if dept.current_patients >= dept.capacity:
             raise ValueError("Department is at full capacity")
         dept.current_patients += 1
-        self.save_departments()
+        self._changed()
 
     def discharge_patient(self, department_name):
         """Discharge a patient from a department"""
@@ -294,18 +571,29 @@ class DepartmentManager:
         if dept.current_patients <= 0:
             raise ValueError("No patients to discharge")
         dept.current_patients -= 1
-        self.save_departments()
+        self._changed()
 
     def get_department_status(self):
-        """Get current status of all departments"""
-        return {
-            name: {
-                'current_patients': dept.current_patients,
-                'capacity': dept.capacity,
-                'occupancy_rate': (dept.current_patients / dept.capacity * 100) if dept.capacity > 0 else 0
-            }
-            for name, dept in self.departments.items()
-        }
+        """Get current status of all departments.
+
+        The result is cached until a department changes, so callers must not modify it."""
+        if self._status_cache is None:
+            status = {}
+            for name, dept in self.departments.items():
+                current, capacity = dept.current_patients, dept.capacity
+                occupancy = (current / capacity * 100) if capacity > 0 else 0
+                key = (current, capacity)
+                display = self._display_cache.get(key)
+                if display is None:
+                    display = self._display_cache[key] = f"{current} ({occupancy:.1f}%)"
+                status[name] = {
+                    'current_patients': current,
+                    'capacity': capacity,
+                    'occupancy_rate': occupancy,
+                    'current_display': display
+                }
+            self._status_cache = status
+        return self._status_cache
 
     def get_available_capacity(self, department_name):
         """Get available capacity in a department"""
@@ -324,116 +612,212 @@ class DepartmentManager:
 # ---------------------------
 # Emergency Alert System with Dynamic Configuration
 # ---------------------------
+class AlertConfig(dict):
+    """Alert code -> {"description", "color"} mapping that notifies subscribers on change.
+
+    Only item assignment and deletion notify, which is all the app uses."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._callbacks = []
+
+    def subscribe(self, callback):
+        self._callbacks.append(callback)
+
+    def _changed(self):
+        for callback in self._callbacks:
+            callback()
+
+    def __setitem__(self, code, config):
+        super().__setitem__(code, config)
+        self._changed()
+
+    def __delitem__(self, code):
+        super().__delitem__(code)
+        self._changed()
+
+@dataclass(slots=True)
+class Alert:
+    code: str
+    description: str
+    location: str
+    timestamp: datetime
+    id: int = -1  # Assigned by EmergencyAlert when the alert becomes active
+
 class EmergencyAlert:
     def __init__(self):
         self.active_alerts = []
-        self.alert_history_file = 'alert_history.json'
+        self._ids = count()  # Session-local alert ids, not persisted
+        self._by_id = {}  # id -> Alert in self.active_alerts
+        self.alert_history_file = 'alert_history.jsonl'
+        self.legacy_history_file = 'alert_history.json'  # JSON array written by older versions
         self.alert_history = self.load_alert_history()
         # Restore last active alerts from history (if any were not cleared)
         self.restore_active_alerts_from_history()
         # Use a dynamic configuration dictionary.
         # Each key is an alert code and its value is a dict with "description" and "color".
-        self.alert_config = {
+        self.alert_config = AlertConfig({
             "Code Blue": {"description": "Cardiac Arrest", "color": "lightblue"},
             "Code Red": {"description": "Fire", "color": "lightcoral"},
             "Code Black": {"description": "Bomb Threat", "color": "gray"},
             "Code Grey": {"description": "Violent Patient", "color": "lightgray"},
             "Code Orange": {"description": "Mass Casualty", "color": "orange"}
-        }
+        })
 
     def load_alert_history(self):
+        # alert_history.jsonl is an append-only log with one alert per line
+        history = []
         try:
+            if not os.path.exists(self.alert_history_file) and os.path.exists(self.legacy_history_file):
+                return self.migrate_legacy_history()
             if os.path.exists(self.alert_history_file):
-                with open(self.alert_history_file, 'r') as f:
-                    return json.load(f)
+                with open(self.alert_history_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            history.append(load_json(line))
+                        except ValueError:
+                            pass  # Skip a torn/corrupt line rather than losing the log
         except Exception:
             pass
-        return []
+        return history
+
+    def migrate_legacy_history(self):
+        """Rewrite the old alert_history.json array as alert_history.jsonl and return its records.
+
+        The old file is left in place; it is only read while the .jsonl log does not exist."""
+        with open(self.legacy_history_file, 'rb') as f:
+            history = load_json(f.read())
+        if not isinstance(history, list):
+            return []
+        write_file_atomic(self.alert_history_file,
+                          b''.join(orjson.dumps(record) + b'\n' for record in history))
+        return history
 
     def restore_active_alerts_from_history(self):
         # Optionally, restore all alerts from history as active (or filter by a flag if you want only uncleared)
         # Here, we restore the last N alerts as active (or all, if you want)
         # You can add a 'cleared' flag to alert_history for more advanced logic
         self.active_alerts = []
-        for alert in self.alert_history:
-            # Convert timestamp back to datetime for display if needed
-            if isinstance(alert.get('timestamp'), str):
-                try:
-                    alert['timestamp'] = datetime.strptime(alert['timestamp'], '%Y-%m-%d %H:%M:%S')
-                except Exception:
-                    pass
-            self.active_alerts.append(alert)
+        self._by_id = {}
+        for record in self.alert_history:
+            try:
+                alert = Alert(record['code'], record['description'], record['location'],
+                              parse_timestamp(record['timestamp']))
+            except Exception:
+                continue  # Skip records too damaged to display
+            self._track(alert)
+
+    def _track(self, alert):
+        alert.id = next(self._ids)
+        self._by_id[alert.id] = alert
+        self.active_alerts.append(alert)
 
     def raise_alert(self, code, location):
         # Look up description from alert_config if available
         description = self.alert_config.get(code, {}).get("description", "Unknown Alert")
-        timestamp = datetime.now()
-        alert = {
-            "code": code,
-            "description": description,
-            "location": location,
-            "timestamp": timestamp
-        }
-        self.active_alerts.append(alert)
+        alert = Alert(code, description, location, datetime.now())
+        self._track(alert)
         self.save_alert_history(alert)
 
     def save_alert_history(self, alert):
-        # Save alert to alert_history.json (append mode) and to self.alert_history
+        # Record the alert once in self.alert_history and once (a single appended
+        # line) in alert_history.jsonl; the existing log is never re-read
+        record = {
+            "code": alert.code,
+            "description": alert.description,
+            "location": alert.location,
+            "timestamp": alert.timestamp.timestamp()  # Stored as epoch seconds
+        }
+        self.alert_history.append(record)
         try:
-            # Convert timestamp to string for JSON
-            alert_to_save = alert.copy()
-            if isinstance(alert_to_save["timestamp"], datetime):
-                alert_to_save["timestamp"] = alert_to_save["timestamp"].strftime('%Y-%m-%d %H:%M:%S')
-            self.alert_history.append(alert_to_save)
-            # Load existing history
-            if os.path.exists(self.alert_history_file):
-                with open(self.alert_history_file, 'r') as f:
-                    history = json.load(f)
-            else:
-                history = []
-            history.append(alert_to_save)
-            with open(self.alert_history_file, 'w') as f:
-                json.dump(history, f, indent=4)
+            with open(self.alert_history_file, 'ab') as f:
+                f.write(orjson.dumps(record) + b'\n')
         except Exception as e:
             pass  # Optionally log error
 
-    def clear_alert(self, index):
-        if 0 <= index < len(self.active_alerts):
-            self.active_alerts.pop(index)
+    def clear_by_id(self, alert_id):
+        """ Clears the active alert with the given id. Returns True if one was removed. """
+        alert = self._by_id.pop(alert_id, None)
+        if alert is None:
+            return False
+        self.active_alerts.remove(alert)
+        return True
+
+    def clear_all(self):
+        self.active_alerts.clear()
+        self._by_id.clear()
 
 # ---------------------------
 # Analytics System
 # ---------------------------
 class AnalyticsSystem:
+    SEVERITY_KEYS = tuple(str(i) for i in range(1, 11))  # JSON keys for severities 1-10
+
     def __init__(self):
         self.analytics_file = 'analytics_data.json'
-        self.severity_counts = self.load_analytics()
+        self.counts = self.load_analytics()  # Patients per severity, indexed by severity (index 0 unused)
+        # Running aggregates of counts, kept in step by every mutator
+        self.total = int(self.counts.sum())
+        self.weighted_sum = int(self.counts @ np.arange(self.counts.size))  # Sum of severity over all patients
+        self.saver = DebouncedSaver(self.save_analytics)
+
+    @property
+    def severity_counts(self):
+        """Dict view {severity: count} of self.counts."""
+        return {i: int(self.counts[i]) for i in range(1, 11)}
+
+    @property
+    def average_severity(self):
+        return self.weighted_sum / self.total if self.total > 0 else 0
+
+    @property
+    def max_severity(self):
+        """Highest severity with at least one patient, or 0 if there are none."""
+        for severity in range(10, 0, -1):
+            if self.counts[severity]:
+                return severity
+        return 0
 
     def load_analytics(self):
         try:
-            with open(self.analytics_file, 'r') as f:
-                data = json.load(f)
+            with open(self.analytics_file, 'rb') as f:
+                data = load_json(f.read())
                 # Ensure all severities 1-10 are present
-                return {int(k): int(v) for k, v in data.items()}
+                return np.array([int(data.get(str(i), 0)) for i in range(11)], dtype=np.int64)
         except Exception:
-            return {i: 0 for i in range(1, 11)}
+            return np.zeros(11, dtype=np.int64)
 
     def save_analytics(self):
         try:
-            with open(self.analytics_file, 'w') as f:
-                json.dump(self.severity_counts, f)
+            # orjson writes the NumPy counts natively, so the elements need no int() conversion
+            self.saver.write(self.analytics_file,
+                             orjson.dumps(dict(zip(self.SEVERITY_KEYS, self.counts[1:])),
+                                          option=orjson.OPT_SERIALIZE_NUMPY))
         except Exception:
             pass
 
+    def reset(self):
+        """Zero every severity count."""
+        self.counts[:] = 0
+        self.total = 0
+        self.weighted_sum = 0
+        self.saver.schedule()
+
     def add_patient_visit(self, department, severity):
         if 1 <= severity <= 10:
-            self.severity_counts[severity] = self.severity_counts.get(severity, 0) + 1
-            self.save_analytics()
+            self.counts[severity] += 1
+            self.total += 1
+            self.weighted_sum += severity
+            self.saver.schedule()
 
     def serve_patient_severity(self, severity):
-        if 1 <= severity <= 10 and self.severity_counts.get(severity, 0) > 0:
-            self.severity_counts[severity] -= 1
-            self.save_analytics()
+        if 1 <= severity <= 10 and self.counts[severity] > 0:
+            self.counts[severity] -= 1
+            self.total -= 1
+            self.weighted_sum -= severity
+            self.saver.schedule()
 
     def generate_department_report(self):
         dept_counts = {}
@@ -443,7 +827,314 @@ class AnalyticsSystem:
         return dept_counts
 
     def generate_severity_report(self):
-        return self.severity_counts.copy()
+        return self.severity_counts
+
+# ---------------------------
+# Treeview Helpers
+# ---------------------------
+def sync_treeview(tree, cache, rows, tags=(), key_iids=False):
+    """Bring a flat Treeview in line with rows while touching only the rows that changed.
+
+    rows is an ordered list of (key, values) pairs with unique keys, and cache
+    is the {key: (iid, values)} dict returned by the previous call for the
+    same tree (empty on the first call). New rows get tags, and with key_iids
+    their (string) key as iid, so a selection maps straight back to its row.
+    Returns the new cache."""
+    new_cache = {}
+    added = []
+    for key, values in rows:
+        entry = cache.get(key)
+        if entry is None:
+            iid = tree.insert('', 'end', iid=key if key_iids else None, values=values, tags=tags)
+            added.append(iid)
+        else:
+            iid, old_values = entry
+            if old_values != values:
+                tree.item(iid, values=values)
+        new_cache[key] = (iid, values)
+    stale = [iid for key, (iid, _) in cache.items() if key not in new_cache]
+    if stale:
+        tree.delete(*stale)
+    # Surviving rows keep their old order and new rows were appended; fix the
+    # order with a single call only if that differs from the requested one
+    shown = [iid for key, (iid, _) in cache.items() if key in new_cache] + added
+    wanted = [iid for iid, _ in new_cache.values()]
+    if shown != wanted:
+        tree.set_children('', *wanted)
+    return new_cache
+
+def insert_rows(tree, rows):
+    """Append rows of (iid, values, tags) to a flat Treeview with direct Tcl calls.
+
+    This skips ttk.Treeview.insert's per-call option formatting. iid may be None
+    to let Tk pick one. Tk already defers redrawing until the event loop is idle,
+    so bulk inserts need no redraw suppression."""
+    call = tree.tk.call
+    widget = tree._w
+    for iid, values, tags in rows:
+        if iid is None:
+            call(widget, 'insert', '', 'end', '-values', values, '-tags', tags)
+        else:
+            call(widget, 'insert', '', 'end', '-id', iid, '-values', values, '-tags', tags)
+
+class VirtualTreeview(ttk.Treeview):
+    """Flat Treeview that only holds the rows currently in view as Tk items.
+
+    The full data set is an ordered list of (key, values) pairs kept in Python;
+    scrolling slides a window over it and sync_treeview swaps rows in and out.
+    Selection, focus and the Shift-range anchor are tracked by key so they
+    survive rows scrolling out of view; clicks and keyboard navigation are
+    handled here because Tk's own bindings only know the rows it holds.
+    row_tags and key_iids are passed on to sync_treeview."""
+
+    def __init__(self, master=None, row_tags=(), key_iids=False, **kw):
+        self._yscrollcommand = kw.pop('yscrollcommand', None)
+        super().__init__(master, **kw)
+        self._row_tags = row_tags
+        self._key_iids = key_iids
+        self._rows = []
+        self._first = 0  # index in self._rows of the top visible row
+        self._page = int(self.cget('height'))  # whole rows that fit; measured once mapped
+        self._row_height = None
+        self._top = 0  # y of the first row, i.e. the heading height
+        self._shown = {}  # sync_treeview cache for the visible window
+        self._selected_keys = set()
+        self._focus_key = None  # row last clicked or navigated to
+        self._anchor_key = None  # fixed end of a Shift range selection
+        self.bind('<Configure>', self._on_configure)
+        self.bind('<MouseWheel>', self._on_mousewheel)
+        self.bind('<Button-4>', lambda e: self._scroll_by(-3))
+        self.bind('<Button-5>', lambda e: self._scroll_by(3))
+        # Widget bindings run before the Treeview class ones that change the selection
+        self.bind('<ButtonPress-1>', self._on_click)
+        for key in ('Up', 'Down', 'Prior', 'Next', 'Home', 'End'):
+            self.bind(f'<KeyPress-{key}>', self._on_key)
+
+    def configure(self, cnf=None, **kw):
+        # The scrollbar is driven from the full row list, not Tk's item count
+        if 'yscrollcommand' in kw:
+            self._yscrollcommand = kw.pop('yscrollcommand')
+            self._update_scrollbar()
+            if cnf is None and not kw:
+                return None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def set_rows(self, rows):
+        """Replace the data set with rows, an ordered list of (key, values) pairs with unique keys."""
+        self._rows = list(rows)
+        self._render()
+        keys = {key for key, _ in self._rows}
+        self._selected_keys &= keys
+        if self._focus_key not in keys:
+            self._focus_key = None
+        if self._anchor_key not in keys:
+            self._anchor_key = None
+
+    def append_row(self, key, values):
+        self._rows.append((key, values))
+        self._render()
+
+    def remove_row(self, key):
+        for i, (row_key, _) in enumerate(self._rows):
+            if row_key == key:
+                del self._rows[i]
+                self._render()
+                # After rendering: _render re-captures the selection while the
+                # removed row's item is still shown and selected
+                self._selected_keys.discard(key)
+                if self._focus_key == key:
+                    self._focus_key = None
+                if self._anchor_key == key:
+                    self._anchor_key = None
+                return
+
+    def selected_rows(self):
+        """(key, values) of every selected row, in display order, including rows scrolled out of view."""
+        self._capture_selection()
+        return [row for row in self._rows if row[0] in self._selected_keys]
+
+    def focused_key(self):
+        """Key of the row with keyboard focus (the last one clicked or navigated to), or None."""
+        return self._focus_key
+
+    def yview(self, *args):
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self._rows)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2].startswith('page'):
+                step *= self._page
+            self._scroll_to(self._first + step)
+
+    def yview_moveto(self, fraction):
+        self.yview('moveto', fraction)
+
+    def yview_scroll(self, number, what):
+        self.yview('scroll', number, what)
+
+    def _fractions(self):
+        total = len(self._rows)
+        if not total:
+            return (0.0, 1.0)
+        return (self._first / total, min(1.0, (self._first + self._page) / total))
+
+    def _update_scrollbar(self):
+        if self._yscrollcommand:
+            self._yscrollcommand(*self._fractions())
+
+    def _scroll_to(self, first):
+        first = max(0, min(first, len(self._rows) - self._page))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _scroll_by(self, step):
+        self._scroll_to(self._first + step)
+        return 'break'
+
+    def _on_mousewheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_configure(self, event):
+        if self._fit_page():
+            self._render()
+
+    def _fit_page(self):
+        """Recompute how many whole rows fit. Returns True if that changed."""
+        if self._row_height is None and self._shown:
+            # Measure a real row once the tree is mapped rather than guessing from the theme
+            box = self.bbox(next(iter(self._shown.values()))[0])
+            if box:
+                self._top, self._row_height = box[1], box[3]
+        if self._row_height is None:
+            return False
+        page = max(1, (self.winfo_height() - self._top) // self._row_height)
+        changed = page != self._page
+        self._page = page
+        return changed
+
+    # event.state bits for the modifiers that extend a selection
+    _SHIFT = 0x0001
+    _CONTROL = 0x0004
+
+    def _key_of(self, iid):
+        for key, (shown_iid, _) in self._shown.items():
+            if shown_iid == iid:
+                return key
+        return None
+
+    def _index_of(self, key):
+        for i, (row_key, _) in enumerate(self._rows):
+            if row_key == key:
+                return i
+        return -1
+
+    def _on_click(self, event):
+        if self.identify_region(event.x, event.y) not in ('tree', 'cell'):
+            return None
+        key = self._key_of(self.identify_row(event.y))
+        if key is None:
+            return None
+        extended = str(self.cget('selectmode')) == 'extended'
+        if extended and event.state & self._SHIFT and self._index_of(self._anchor_key) >= 0:
+            # Tk can only extend to an anchor it still holds, so ranges are built by key
+            self.focus_set()
+            self._select(self._index_of(key), extend=True)
+            return 'break'
+        # Tk's class binding now selects the clicked row itself; a plain click
+        # replaces the whole selection, so rows scrolled out of view go too
+        if not extended or not event.state & self._CONTROL:
+            self._selected_keys.clear()
+        self._focus_key = self._anchor_key = key
+        # Tk scrolls its own view to a clicked partly visible bottom row
+        self.after_idle(self._reconcile_view)
+        return None
+
+    def _on_key(self, event):
+        # Tk's navigation stops at the last row it holds and its paging bypasses
+        # yview(), so moves are done over the full row list instead
+        if not self._rows:
+            return 'break'
+        index = self._index_of(self._focus_key)
+        moves = {'Up': -1, 'Down': 1, 'Prior': -self._page, 'Next': self._page}
+        if event.keysym == 'Home':
+            target = 0
+        elif event.keysym == 'End':
+            target = len(self._rows) - 1
+        elif index < 0:
+            target = 0
+        else:
+            target = max(0, min(index + moves[event.keysym], len(self._rows) - 1))
+        extend = str(self.cget('selectmode')) == 'extended' and event.state & self._SHIFT
+        self._select(target, extend=extend and self._index_of(self._anchor_key) >= 0)
+        return 'break'
+
+    def _select(self, index, extend=False):
+        """Focus the row at index, scroll it into view and select it, or the range
+        from the anchor to it with extend."""
+        key = self._rows[index][0]
+        if extend:
+            anchor = self._index_of(self._anchor_key)
+            low, high = min(anchor, index), max(anchor, index)
+            self._selected_keys = {row_key for row_key, _ in self._rows[low:high + 1]}
+        else:
+            self._selected_keys = {key}
+            self._anchor_key = key
+        self._focus_key = key
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + self._page:
+            self._first = index - self._page + 1
+        if not self._render(capture=False):
+            # Tk only reports selection changes among the rows it holds
+            self.event_generate('<<TreeviewSelect>>')
+
+    def _reconcile_view(self):
+        # Fold any scrolling Tk did of its own view into the window
+        top = super().yview()[0]
+        if top and self._shown:
+            self._first += round(top * len(self._shown))
+            self._render()
+
+    def _capture_selection(self):
+        selected = set(self.selection())
+        for key, (iid, _) in self._shown.items():
+            if iid in selected:
+                self._selected_keys.add(key)
+            else:
+                self._selected_keys.discard(key)
+
+    def _sync_window(self):
+        self._first = max(0, min(self._first, len(self._rows) - self._page))
+        # One extra row covers a partly visible row at the bottom
+        window = self._rows[self._first:self._first + self._page + 1]
+        self._shown = sync_treeview(self, self._shown, window, self._row_tags, self._key_iids)
+
+    def _render(self, capture=True):
+        """Show the window at self._first. Returns True if the Tk selection had to change.
+
+        capture=False keeps _selected_keys as set, instead of first reading back
+        the selection Tk holds for the old window."""
+        if capture:
+            self._capture_selection()
+        self._sync_window()
+        if self._fit_page():
+            self._sync_window()
+        # Tk's own view always stays at the top; scrolling is done by changing the window
+        super().yview_moveto(0)
+        focus = self._shown.get(self._focus_key)
+        if focus is not None and self.focus() != focus[0]:
+            self.focus(focus[0])
+        wanted = [iid for key, (iid, _) in self._shown.items() if key in self._selected_keys]
+        changed = set(wanted) != set(self.selection())
+        if changed:
+            self.selection_set(wanted)
+        self._update_scrollbar()
+        return changed
 
 # ---------------------------
 # Main Application with Page Navigation
@@ -456,6 +1147,7 @@ class HospitalManagementApp(tk.Tk):
 
         # Initialize custom styles
         self.style = CustomStyle()
+        configure_styles(self.style)
         self.configure(background=self.style.bg_color)
         
         # Create a main container
@@ -509,6 +1201,21 @@ class HospitalManagementApp(tk.Tk):
         self.analytics = AnalyticsSystem()
         # Link analytics to scheduler for decrement on serve
         self.scheduler.analytics = self.analytics
+        # Saves are debounced on the Tk loop, written on a background thread and
+        # flushed on close
+        self.stores = (self.scheduler, self.patient_db, self.department_mgr, self.analytics)
+        self.writer = AsyncWriter()
+        for store in self.stores:
+            store.saver.root = self
+            store.saver.writer = self.writer
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Status bar for success messages; only errors get a modal dialog
+        self.status_var = tk.StringVar()
+        self._status_job = None
+        ttk.Label(self.main_container,
+                  textvariable=self.status_var,
+                  style="Subheader.TLabel").pack(side=tk.BOTTOM, fill='x', pady=(10, 0))
 
         # Container to hold all pages
         self.container = ttk.Frame(self.main_container)
@@ -516,27 +1223,74 @@ class HospitalManagementApp(tk.Tk):
         self.container.grid_rowconfigure(0, weight=1)
         self.container.grid_columnconfigure(0, weight=1)
 
-        # Dictionary to hold pages
+        # Dictionary to hold pages; each page is built the first time it is shown
         self.frames = {}
-        for F in (HomePage, AppointmentPage, PatientManagementPage,
-                 EmergencyAlertsPage, AnalyticsPage, AlertConfigPage,
-                 DepartmentManagementPage):
-            frame = F(parent=self.container, controller=self)
-            self.frames[F] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+
+        # Page refreshes requested through schedule_refresh(), by target name
+        self.refresh_targets = {
+            'home_patients': (HomePage, 'refresh_patient_stats'),
+            'home_alerts': (HomePage, 'refresh_alert_stats'),
+            'home_departments': (HomePage, 'refresh_department_stats'),
+            'appointments': (AppointmentPage, 'refresh_lists'),
+            'alerts': (EmergencyAlertsPage, 'update_emergency_display'),
+            'analytics': (AnalyticsPage, 'update_analytics'),
+            'departments': (DepartmentManagementPage, 'refresh_departments'),
+        }
+        self._pending_refresh = set()
+        self._refresh_job = None
 
         self.show_frame(HomePage)
-        
-        # Start updating time
-        self.after(1000, self.update_time)
+
+    def schedule_refresh(self, targets):
+        """Refresh the named pages once the event loop is idle.
+
+        Requests made before then are merged, so a burst of mutations redraws
+        each page (and the analytics chart) only once."""
+        self._pending_refresh.update(targets)
+        if self._refresh_job is None:
+            self._refresh_job = self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        targets, self._pending_refresh = self._pending_refresh, set()
+        self._refresh_job = None
+        for target in targets:
+            page, method = self.refresh_targets[target]
+            frame = self.frames.get(page)
+            # Pages that were never shown are up to date once they are built
+            if frame is not None:
+                getattr(frame, method)()
+
+    def set_status(self, message, clear_ms=3000):
+        """Show message in the status bar without blocking the event loop."""
+        self.status_var.set(message)
+        # A newer message restarts the timer rather than being cleared early
+        if self._status_job is not None:
+            self.after_cancel(self._status_job)
+        self._status_job = self.after(clear_ms, self._clear_status)
+
+    def _clear_status(self):
+        self._status_job = None
+        self.status_var.set("")
+
+    def on_close(self):
+        for store in self.stores:
+            store.saver.flush()
+        self.writer.close()
+        self.destroy()
 
     def update_time(self):
-        current_time = datetime.now().strftime("%I:%M %p, %B %d, %Y")
-        self.time_label.config(text=current_time)
-        self.after(1000, self.update_time)
+        now = datetime.now()
+        self.time_label.config(text=now.strftime("%I:%M %p, %B %d, %Y"))
+        # The clock shows no seconds, so only wake up again at the next minute boundary
+        delay_ms = (60 - now.second) * 1000 - now.microsecond // 1000
+        self.after(delay_ms, self.update_time)
 
     def show_frame(self, page):
-        frame = self.frames[page]
+        frame = self.frames.get(page)
+        if frame is None:
+            frame = page(parent=self.container, controller=self)
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[page] = frame
         frame.tkraise()
         # If showing AnalyticsPage, update analytics automatically
         if page == AnalyticsPage:
@@ -548,13 +1302,12 @@ class HospitalManagementApp(tk.Tk):
 # ---------------------------
 # Home Page
 # ---------------------------
-class HomePage(tk.Frame):
+class HomePage(ttk.Frame):
     def __init__(self, parent, controller):
-        super().__init__(parent)
+        # Modern dashboard background
+        super().__init__(parent, style="Home.TFrame")
         self.controller = controller
         self.queue_file = 'queue_demo.json'
-        # Modern dashboard background
-        self.configure(background='#f7fafd')
 
         # Main card frame (shadow effect)
         self.card = tk.Frame(self, bg='white', bd=0, highlightthickness=0)
@@ -577,6 +1330,7 @@ class HomePage(tk.Frame):
         stats_frame = tk.Frame(self.card, bg='white')
         stats_frame.pack(fill='x', pady=(10, 30), padx=40)
         self.stats_labels = {}
+        self.stats_values = {}  # Last value shown on each stat card
         stats = [
             ("👤 Total Patients", "total_patients", '#4f8cff'),
             ("🚨 Active Alerts", "active_alerts", '#e74c3c'),
@@ -615,9 +1369,6 @@ class HomePage(tk.Frame):
         tk.Label(input_frame, text="Priority (1-10):", font=('Segoe UI', 10), bg='white').pack(side=tk.LEFT, padx=5)
         self.priority_entry = ttk.Entry(input_frame, width=5, font=('Segoe UI', 10))
         self.priority_entry.pack(side=tk.LEFT, padx=5)
-        style = ttk.Style()
-        style.configure('Modern.TButton', font=('Segoe UI', 11, 'bold'), background='#ffffff', foreground='#000000', padding=8, borderwidth=0)
-        style.map('Modern.TButton', background=[('active', '#e3e8ee')], foreground=[('active', '#000000')])
         ttk.Button(input_frame, text="Add Patient", command=self.add_demo_patient, style='Modern.TButton').pack(side=tk.LEFT, padx=10)
         ttk.Button(input_frame, text="Serve Next", command=self.serve_demo_patient, style='Modern.TButton').pack(side=tk.LEFT, padx=5)
 
@@ -626,46 +1377,44 @@ class HomePage(tk.Frame):
         self.canvas.grid(row=2, column=0, sticky='ew', padx=20, pady=(0, 10))
         self.status_label = tk.Label(queue_card, text="Current Queue: Empty", font=('Segoe UI', 10, 'bold'), fg='#7b8a97', bg='white')
         self.status_label.grid(row=3, column=0, sticky='w', padx=20, pady=(0, 10))
+        # Canvas item ids per drawn queue node, reused across redraws
+        self._rect_ids = []
+        self._name_ids = []
+        self._prio_ids = []
+        self._arrow_ids = []  # _arrow_ids[i] links node i to node i + 1
+        self._node_values = []  # (priority, name) currently shown by each node
 
         # Initialize demo queue
         self.demo_queue = self.load_demo_queue()
         self.refresh_stats()
-        self.bind_events()
         self.update_visualization()
 
     def load_demo_queue(self):
         try:
-            with open(self.queue_file, 'r') as f:
-                data = json.load(f)
+            with open(self.queue_file, 'rb') as f:
+                data = load_json(f.read())
                 # Ensure it's a list of [priority, name]
                 if isinstance(data, list) and all(isinstance(item, list) and len(item) == 2 for item in data):
-                    return [(int(priority), str(name)) for priority, name in data]
+                    queue = [(int(priority), str(name)) for priority, name in data]
+                    heapq.heapify(queue)
+                    return queue
         except Exception:
             pass
         return []
 
     def save_demo_queue(self):
         try:
-            with open(self.queue_file, 'w') as f:
-                json.dump(self.demo_queue, f)
+            self.controller.writer.submit(self.queue_file, orjson.dumps(self.demo_queue))
         except Exception:
             pass
 
-    def bind_events(self):
-        # Add hover effects to buttons
-        for widget in self.winfo_children():
-            if isinstance(widget, ttk.Button):
-                widget.bind("<Enter>", lambda e: e.widget.state(['pressed']))
-                widget.bind("<Leave>", lambda e: e.widget.state(['!pressed']))
-
     def add_demo_patient(self):
         name = self.name_entry.get().strip()
         priority = self.priority_entry.get().strip()
         if not name or not priority.isdigit() or not (1 <= int(priority) <= 10):
             messagebox.showerror("Error", "Please enter valid name and priority (1-10)")
             return
-        self.demo_queue.append((int(priority), name))
-        self.demo_queue.sort()
+        heapq.heappush(self.demo_queue, (int(priority), name))
         self.name_entry.delete(0, tk.END)
         self.priority_entry.delete(0, tk.END)
         self.save_demo_queue()
@@ -673,51 +1422,92 @@ class HomePage(tk.Frame):
 
     def serve_demo_patient(self):
         if not self.demo_queue:
-            messagebox.showinfo("Queue Empty", "No patients in queue")
+            self.controller.set_status("No patients in queue")
             return
-        priority, name = self.demo_queue.pop(0)
-        messagebox.showinfo("Serving Patient", f"Now serving: {name} (Priority: {priority})")
+        priority, name = heapq.heappop(self.demo_queue)
+        self.controller.set_status(f"Now serving: {name} (Priority: {priority})")
         self.save_demo_queue()
         self.update_visualization()
 
+    # Demo queue node geometry; node i always sits at the same position
+    BOX_WIDTH = 100
+    BOX_HEIGHT = 50
+    BOX_SPACING = 30
+    BOX_START_X = 40
+    BOX_Y = 60
+
+    def _create_node(self, i):
+        w, h, y = self.BOX_WIDTH, self.BOX_HEIGHT, self.BOX_Y
+        x = self.BOX_START_X + i * (w + self.BOX_SPACING)
+        self._rect_ids.append(self.canvas.create_rectangle(x, y-h/2, x+w, y+h/2, fill='#ffffff', outline='#4f8cff', width=2))
+        self._name_ids.append(self.canvas.create_text(x+w/2, y-10, font=('Segoe UI', 11, 'bold'), fill='#2c3e50'))
+        self._prio_ids.append(self.canvas.create_text(x+w/2, y+12, font=('Segoe UI', 10), fill='#2c3e50'))
+        self._node_values.append(None)
+        if i > 0:
+            # Arrow from the previous node into this one
+            self._arrow_ids.append(self.canvas.create_line(x-self.BOX_SPACING+10, y, x-10, y, arrow=tk.LAST, fill='#4f8cff', width=2))
+
+    def _remove_last_node(self):
+        ids = [self._rect_ids.pop(), self._name_ids.pop(), self._prio_ids.pop()]
+        self._node_values.pop()
+        if self._arrow_ids:
+            ids.append(self._arrow_ids.pop())
+        self.canvas.delete(*ids)
+
     def update_visualization(self):
-        self.canvas.delete("all")
-        if not self.demo_queue:
+        # demo_queue is a heap; draw it in serving order
+        queue = heapq.nsmallest(len(self.demo_queue), self.demo_queue)
+        resized = len(queue) != len(self._rect_ids)
+        while len(self._rect_ids) < len(queue):
+            self._create_node(len(self._rect_ids))
+        while len(self._rect_ids) > len(queue):
+            self._remove_last_node()
+        # Only touch the labels of nodes whose patient changed
+        for i, value in enumerate(queue):
+            if self._node_values[i] != value:
+                priority, name = value
+                self.canvas.itemconfig(self._name_ids[i], text=name)
+                self.canvas.itemconfig(self._prio_ids[i], text=f"Priority: {priority}")
+                self._node_values[i] = value
+        if not queue:
             self.status_label.config(text="Current Queue: Empty")
             return
-        self.status_label.config(text=f"Current Queue: {len(self.demo_queue)} patients")
-        box_width = 100
-        box_height = 50
-        spacing = 30
-        start_x = 40
-        y = 60
-        for i, (priority, name) in enumerate(self.demo_queue):
-            x = start_x + i * (box_width + spacing)
-            self.canvas.create_rectangle(x, y-box_height/2, x+box_width, y+box_height/2, fill='#ffffff', outline='#4f8cff', width=2)
-            self.canvas.create_text(x+box_width/2, y-10, text=name, font=('Segoe UI', 11, 'bold'), fill='#2c3e50')
-            self.canvas.create_text(x+box_width/2, y+12, text=f"Priority: {priority}", font=('Segoe UI', 10), fill='#2c3e50')
-            if i < len(self.demo_queue) - 1:
-                self.canvas.create_line(x+box_width+10, y, x+box_width+spacing-10, y, arrow=tk.LAST, fill='#4f8cff', width=2)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.status_label.config(text=f"Current Queue: {len(queue)} patients")
+        if resized:
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def set_stat(self, key, value):
+        # Skip the Tk round-trip when the card already shows this value
+        if self.stats_values.get(key) != value:
+            self.stats_values[key] = value
+            self.stats_labels[key].config(text=str(value))
 
     def refresh_stats(self):
-        total_patients = len(self.controller.patient_db.get_all_patients())
-        self.stats_labels['total_patients'].config(text=str(total_patients))
-        active_alerts = len(self.controller.emergency.active_alerts)
-        self.stats_labels['active_alerts'].config(text=str(active_alerts))
-        departments = len(self.controller.department_mgr.departments)
-        self.stats_labels['departments'].config(text=str(departments))
-        appointments = len(self.controller.scheduler.get_waiting_list())
-        self.stats_labels['appointments'].config(text=str(appointments))
+        # Every count is an O(1) len()/counter read on the data model
+        self.refresh_patient_stats()
+        self.refresh_alert_stats()
+        self.refresh_department_stats()
+
+    # Mutators schedule only the part of the dashboard their data feeds
+    def refresh_patient_stats(self):
+        self.set_stat('total_patients', len(self.controller.patient_db.patients))
+        self.set_stat('appointments', self.controller.scheduler.size)
+
+    def refresh_alert_stats(self):
+        self.set_stat('active_alerts', len(self.controller.emergency.active_alerts))
+
+    def refresh_department_stats(self):
+        self.set_stat('departments', len(self.controller.department_mgr.departments))
 
 # ---------------------------
 # Appointment Page
 # ---------------------------
-class AppointmentPage(tk.Frame):
+class AppointmentPage(ttk.Frame):
     def __init__(self, parent, controller):
-        super().__init__(parent)
+        super().__init__(parent, style="Page.TFrame")
         self.controller = controller
-        self.configure(background=self.controller.style.bg_color)
+        # Set before the form is built, since building the combobox loads it
+        self._last_depts = ()  # Departments last loaded into the combobox
         
         # Create main content frame
         content_frame = ttk.Frame(self)
@@ -802,7 +1592,7 @@ class AppointmentPage(tk.Frame):
         notebook.add(wait_frame, text="Waiting Queue")
         
         # Create Treeview for waiting queue
-        self.waiting_tree = ttk.Treeview(wait_frame,
+        self.waiting_tree = VirtualTreeview(wait_frame,
                                        columns=('Name', 'Severity', 'Department'),
                                        show='headings')
         
@@ -822,7 +1612,7 @@ class AppointmentPage(tk.Frame):
         notebook.add(served_frame, text="Appointment History")
         
         # Create Treeview for served patients
-        self.served_tree = ttk.Treeview(served_frame,
+        self.served_tree = VirtualTreeview(served_frame,
                                       columns=('Name', 'Severity', 'Department', 'Time'),
                                       show='headings')
         
@@ -838,22 +1628,19 @@ class AppointmentPage(tk.Frame):
         self.served_tree.pack(side=tk.LEFT, fill='both', expand=True)
         served_scrollbar.pack(side=tk.RIGHT, fill='y')
         
-        # Add hover effects
-        self.bind_events()
+        self._served_source = None  # Served list the cached rows were built from
+        self._served_rows = []  # (key, values) for each served patient, in order
         
         # Initial refresh
         self.refresh_lists()
     
-    def bind_events(self):
-        # Add hover effects to buttons
-        for widget in self.winfo_children():
-            if isinstance(widget, ttk.Button):
-                widget.bind("<Enter>", lambda e: e.widget.state(['pressed']))
-                widget.bind("<Leave>", lambda e: e.widget.state(['!pressed']))
-
     def update_department_list(self):
         """Update the department combobox with current departments"""
-        departments = list(self.controller.department_mgr.departments.keys())
+        departments = tuple(self.controller.department_mgr.departments)
+        # Skip the Tk reconfigure (and keep the user's pick) when nothing changed
+        if departments == self._last_depts:
+            return
+        self._last_depts = departments
         self.entries['department_entry']['values'] = departments
         if departments:
             self.entries['department_entry'].set(departments[0])
@@ -866,76 +1653,71 @@ class AppointmentPage(tk.Frame):
             messagebox.showerror("Invalid Input", "Please enter valid name, severity (1-10), and department")
             return
         # Check for duplicate name and department in waiting list
-        for sev, _, n, dept in self.controller.scheduler.get_waiting_list():
-            if n == name and dept == department:
-                messagebox.showerror("Duplicate Error", f"An appointment for {name} in {department} already exists.")
-                return
+        if self.controller.scheduler.is_waiting(name, department):
+            messagebox.showerror("Duplicate Error", f"An appointment for {name} in {department} already exists.")
+            return
         # Add patient with department information
         self.controller.scheduler.add_patient(name, int(severity), department)
         self.controller.analytics.add_patient_visit(department, int(severity))
-        messagebox.showinfo("Success", f"Appointment booked for {name} in {department}")
+        self.controller.set_status(f"Appointment booked for {name} in {department}")
         # Clear entries
         for entry in self.entries.values():
             if isinstance(entry, ttk.Entry):
                 entry.delete(0, tk.END)
-        self.refresh_lists()
-        self.controller.frames[HomePage].refresh_stats()
-        self.controller.frames[AnalyticsPage].update_analytics()
+        self.controller.schedule_refresh({'appointments', 'home_patients', 'analytics'})
 
     def serve_patient(self):
         result = self.controller.scheduler.serve_patient()
         # Also decrement analytics severity count
         # (Handled in HospitalScheduler.serve_patient if analytics is set)
-        messagebox.showinfo("Serving Patient", result)
-        self.refresh_lists()
-        self.controller.frames[HomePage].refresh_stats()
-        self.controller.frames[AnalyticsPage].update_analytics()
+        self.controller.set_status(result)
+        self.controller.schedule_refresh({'appointments', 'home_patients', 'analytics'})
 
     def refresh_lists(self):
         # Update department list first
         self.update_department_list()
         
-        # Clear existing items
-        for item in self.waiting_tree.get_children():
-            self.waiting_tree.delete(item)
-        for item in self.served_tree.get_children():
-            self.served_tree.delete(item)
-        
-        # Add waiting patients with their departments
-        for severity, _, name, department in self.controller.scheduler.get_waiting_list():  # Modified to include department
-            self.waiting_tree.insert('', 'end', values=(name, severity, department))
-        
-        # Add served patients with their departments
-        for name, severity, department, timestamp in self.controller.scheduler.get_served_list():  # Modified to include department
-            self.served_tree.insert('', 'end', values=(
-                name,
-                severity,
-                department,
-                timestamp.strftime("%H:%M:%S") if isinstance(timestamp, datetime) else timestamp
+        # The trees only materialize the rows in view.
+        # Waiting patients are unique per (name, department)
+        self.waiting_tree.set_rows([
+            ((name, department), (name, severity, department))
+            for severity, name, department in self.controller.scheduler.get_waiting_list()
+        ])
+        
+        # The served list only grows until the scheduler replaces it (clear or
+        # load), so each row, and its strftime, is built once and keyed by its
+        # position in the list; name and time alone can repeat
+        served = self.controller.scheduler.get_served_list()
+        if served is not self._served_source:
+            self._served_source = served
+            self._served_rows = []
+        start = len(self._served_rows)
+        self._served_rows.extend(
+            (i, (
+                patient.name,
+                patient.severity,
+                patient.department,
+                patient.timestamp.strftime("%H:%M:%S")
             ))
+            for i, patient in enumerate(islice(served, start, None), start)
+        )
+        self.served_tree.set_rows(self._served_rows)
 
     def clear_appointment_history(self):
         # Clear scheduler's waiting and served lists
-        self.controller.scheduler.pq = []
-        self.controller.scheduler.served_patients = []
-        self.controller.scheduler.counter = 0
-        self.controller.scheduler.save_appointments()
+        self.controller.scheduler.clear()
         # Reset analytics
-        self.controller.analytics.severity_counts = {i: 0 for i in range(1, 11)}
-        self.controller.analytics.save_analytics()
-        self.refresh_lists()
-        self.controller.frames[HomePage].refresh_stats()
-        self.controller.frames[AnalyticsPage].update_analytics()
-        messagebox.showinfo("Cleared", "All appointment history and analytics have been cleared.")
+        self.controller.analytics.reset()
+        self.controller.schedule_refresh({'appointments', 'home_patients', 'analytics'})
+        self.controller.set_status("All appointment history and analytics have been cleared.")
 
 # ---------------------------
 # Patient Management Page
 # ---------------------------
-class PatientManagementPage(tk.Frame):
+class PatientManagementPage(ttk.Frame):
     def __init__(self, parent, controller):
-        super().__init__(parent)
+        super().__init__(parent, style="Page.TFrame")
         self.controller = controller
-        self.configure(background=self.controller.style.bg_color)
         
         # Create main content frame
         content_frame = ttk.Frame(self)
@@ -995,7 +1777,7 @@ class PatientManagementPage(tk.Frame):
         list_frame.pack(fill='both', expand=True)
         
         # Create Treeview for patients
-        self.patient_tree = ttk.Treeview(list_frame,
+        self.patient_tree = VirtualTreeview(list_frame,
                                        columns=('Name', 'Age', 'Gender', 'Contact'),
                                        show='headings')
         
@@ -1027,16 +1809,6 @@ class PatientManagementPage(tk.Frame):
 
         # Load patient list on startup
         self.refresh_patient_list()
-        
-        # Add hover effects
-        self.bind_events()
-    
-    def bind_events(self):
-        # Add hover effects to buttons
-        for widget in self.winfo_children():
-            if isinstance(widget, ttk.Button):
-                widget.bind("<Enter>", lambda e: e.widget.state(['pressed']))
-                widget.bind("<Leave>", lambda e: e.widget.state(['!pressed']))
 
     def register_patient(self):
         patient_data = {}
@@ -1051,7 +1823,7 @@ class PatientManagementPage(tk.Frame):
         patient_data["Admission Date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         added = self.controller.patient_db.add_patient(patient_data)
         if added:
-            messagebox.showinfo("Success", f"Patient {patient_data['Name']} registered successfully!")
+            self.controller.set_status(f"Patient {patient_data['Name']} registered successfully!")
             # Clear entries
             for field, entry in self.patient_entries.items():
                 if field == 'Gender':
@@ -1060,49 +1832,46 @@ class PatientManagementPage(tk.Frame):
                     self.bloodtype_var.set('A+')
                 else:
                     entry.delete(0, tk.END)
-            self.refresh_patient_list()
-            # Refresh home page stats
-            self.controller.frames[HomePage].refresh_stats()
+            self._insert_one(patient_data)
+            self.controller.schedule_refresh({'home_patients'})
+
+    @staticmethod
+    def _patient_values(patient):
+        return (patient['Name'], patient['Age'], patient['Gender'], patient['Contact'])
+
+    def _insert_one(self, patient):
+        self.patient_tree.append_row(patient['ID'], self._patient_values(patient))
+
+    def _delete_one(self, patient_id):
+        self.patient_tree.remove_row(patient_id)
 
     def refresh_patient_list(self):
-        # Clear existing items
-        for item in self.patient_tree.get_children():
-            self.patient_tree.delete(item)
-        
-        # Add patients to treeview
-        for patient in self.controller.patient_db.get_all_patients():
-            self.patient_tree.insert('', 'end', values=(
-                patient['Name'],
-                patient['Age'],
-                patient['Gender'],
-                patient['Contact']
-            ))
+        self.patient_tree.set_rows([(patient['ID'], self._patient_values(patient))
+                                    for patient in self.controller.patient_db.get_all_patients()])
 
     def delete_selected_patient(self):
-        selected = self.patient_tree.selection()
+        selected = self.patient_tree.selected_rows()
         if not selected:
             messagebox.showerror("Error", "Please select a patient to delete.")
             return
         deleted_any = False
-        for sel in selected:
-            patient_name = self.patient_tree.item(sel)['values'][0]
+        # Rows are keyed by patient ID, so no values need to be parsed back
+        for patient_id, values in selected:
             confirm = messagebox.askyesno("Confirm Delete",
-                                        f"Are you sure you want to delete patient {patient_name}?")
-            if confirm:
-                self.controller.patient_db.delete_patient(patient_name)
+                                        f"Are you sure you want to delete patient {values[0]}?")
+            if confirm and self.controller.patient_db.delete_patient_by_id(patient_id):
+                self._delete_one(patient_id)
                 deleted_any = True
         if deleted_any:
-            messagebox.showinfo("Deleted", "Selected patient(s) have been deleted.")
-            self.refresh_patient_list()
-            # Refresh home page stats
-            self.controller.frames[HomePage].refresh_stats()
+            self.controller.set_status("Selected patient(s) have been deleted.")
+            self.controller.schedule_refresh({'home_patients'})
 
 # ---------------------------
 # Emergency Alerts Page (Creative Version)
 # ---------------------------
-class EmergencyAlertsPage(tk.Frame):
+class EmergencyAlertsPage(ttk.Frame):
     def __init__(self, parent, controller):
-        super().__init__(parent)
+        super().__init__(parent, style="Page.TFrame")
         self.controller = controller
         title = ttk.Label(self, text="Emergency Alerts", font=("Arial", 20))
         title.pack(pady=10)
@@ -1116,10 +1885,9 @@ class EmergencyAlertsPage(tk.Frame):
         control_frame.pack(fill='x', padx=10, pady=5)
 
         ttk.Label(control_frame, text="Alert Code:").grid(row=0, column=0, padx=5, pady=5)
-        self.alert_code = ttk.Combobox(control_frame, values=list(controller.emergency.alert_config.keys()), state='readonly')
+        self.alert_code = ttk.Combobox(control_frame, state='readonly')
         self.alert_code.grid(row=0, column=1, padx=5, pady=5)
-        if controller.emergency.alert_config:
-            self.alert_code.set(list(controller.emergency.alert_config.keys())[0])
+        self.update_alert_codes()
 
         ttk.Label(control_frame, text="Location:").grid(row=1, column=0, padx=5, pady=5)
         self.alert_location = ttk.Entry(control_frame)
@@ -1149,8 +1917,10 @@ class EmergencyAlertsPage(tk.Frame):
         self.alerts_tree.heading('Time', text='Time')
         self.alerts_tree.pack(fill='both', expand=True, padx=5, pady=5)
 
-        # Setup treeview tags dynamically based on the alert configuration
+        # Setup treeview tags dynamically based on the alert configuration,
+        # and keep them and the code list in step with later config changes
         self.update_tree_tags()
+        controller.emergency.alert_config.subscribe(self.on_alert_config_changed)
 
         # Back to Home button
         ttk.Button(self, text="Back to Home", command=lambda: controller.show_frame(HomePage))\
@@ -1163,6 +1933,17 @@ class EmergencyAlertsPage(tk.Frame):
         # Show all currently active alerts (if any) in the table
         self.update_emergency_display()
 
+    def update_alert_codes(self):
+        alert_config = self.controller.emergency.alert_config
+        self.alert_code['values'] = tuple(alert_config)
+        # Keep the current pick unless its code was removed
+        if self.alert_code.get() not in alert_config:
+            self.alert_code.set(next(iter(alert_config), ""))
+
+    def on_alert_config_changed(self):
+        self.update_alert_codes()
+        self.update_tree_tags()
+
     def update_tree_tags(self):
         # Clear existing tags and set new ones based on alert_config colors
         for code, config in self.controller.emergency.alert_config.items():
@@ -1173,64 +1954,54 @@ class EmergencyAlertsPage(tk.Frame):
         location = self.alert_location.get()
         if code and location:
             self.controller.emergency.raise_alert(code, location)
-            self.update_emergency_display()
+            self.controller.schedule_refresh({'alerts', 'home_alerts'})
             # Display a flash message in the configured color
             color = self.controller.emergency.alert_config.get(code, {}).get("color", "red")
             self.flash_label.config(text=f"{code} alert raised!", foreground=color)
             self.after(3000, lambda: self.flash_label.config(text=""))
             messagebox.showwarning("Emergency Alert", f"{code} alert raised for {location}!")
-            # Refresh HomePage stats
-            self.controller.frames[HomePage].refresh_stats()
         else:
             messagebox.showerror("Error", "Please fill in all fields!")
 
     def update_emergency_display(self):
-        # Clear the treeview
-        for item in self.alerts_tree.get_children():
-            self.alerts_tree.delete(item)
+        # Clear the treeview in a single Tcl call
+        children = self.alerts_tree.get_children()
+        if children:
+            self.alerts_tree.delete(*children)
         # Insert each active alert with its color tag
-        for alert in self.controller.emergency.active_alerts:
-            tag = alert['code'] if alert['code'] in self.controller.emergency.alert_config else ""
-            self.alerts_tree.insert('', 'end', values=(
-                alert['code'],
-                alert['description'],
-                alert['location'],
-                alert['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-            ), tags=(tag,))
-        self.update_tree_tags()
+        alert_config = self.controller.emergency.alert_config
+        insert_rows(self.alerts_tree, (
+            (str(alert.id), (
+                alert.code,
+                alert.description,
+                alert.location,
+                alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')
+            ), (alert.code if alert.code in alert_config else "",))
+            for alert in self.controller.emergency.active_alerts
+        ))
 
     def clear_selected_alert(self):
         selected = self.alerts_tree.selection()
         if not selected:
             messagebox.showerror("Error", "Please select an alert to clear.")
             return
-        # Retrieve details of the selected alert
-        item = self.alerts_tree.item(selected[0])
-        code = item['values'][0]
-        location = item['values'][2]
-        # Find and remove the corresponding alert from the active alerts list
-        for i, alert in enumerate(self.controller.emergency.active_alerts):
-            if alert['code'] == code and alert['location'] == location:
-                self.controller.emergency.clear_alert(i)
-                break
-        self.update_emergency_display()
-        messagebox.showinfo("Cleared", "Selected alert has been cleared.")
-        # Refresh HomePage stats
-        self.controller.frames[HomePage].refresh_stats()
+        # Rows are inserted with the alert id as their iid
+        for iid in selected:
+            self.controller.emergency.clear_by_id(int(iid))
+        self.controller.schedule_refresh({'alerts', 'home_alerts'})
+        self.controller.set_status("Selected alert has been cleared.")
 
     def clear_all_alerts(self):
-        self.controller.emergency.active_alerts = []
-        self.update_emergency_display()
-        messagebox.showinfo("Cleared", "All alerts have been cleared.")
-        # Refresh HomePage stats
-        self.controller.frames[HomePage].refresh_stats()
+        self.controller.emergency.clear_all()
+        self.controller.schedule_refresh({'alerts', 'home_alerts'})
+        self.controller.set_status("All alerts have been cleared.")
 
 # ---------------------------
 # Alert Configuration Page
 # ---------------------------
-class AlertConfigPage(tk.Frame):
+class AlertConfigPage(ttk.Frame):
     def __init__(self, parent, controller):
-        super().__init__(parent)
+        super().__init__(parent, style="Page.TFrame")
         self.controller = controller
         title = ttk.Label(self, text="Alert Configuration", font=("Arial", 20))
         title.pack(pady=10)
@@ -1267,8 +2038,9 @@ class AlertConfigPage(tk.Frame):
         # Back to Home button
         ttk.Button(self, text="Back to Home", command=lambda: controller.show_frame(HomePage)).pack(pady=10)
 
-        # Load existing configurations
+        # Load existing configurations and follow later changes
         self.refresh_config_list()
+        controller.emergency.alert_config.subscribe(self.refresh_config_list)
 
     def choose_color(self):
         # Open a color chooser and update the color entry
@@ -1286,8 +2058,7 @@ class AlertConfigPage(tk.Frame):
             return
         # Update the emergency alert configuration dynamically
         self.controller.emergency.alert_config[code] = {"description": desc, "color": color}
-        messagebox.showinfo("Success", f"Configuration for {code} added/updated.")
-        self.refresh_config_list()
+        self.controller.set_status(f"Configuration for {code} added/updated.")
         # Clear entries
         self.code_entry.delete(0, tk.END)
         self.desc_entry.delete(0, tk.END)
@@ -1311,19 +2082,15 @@ class AlertConfigPage(tk.Frame):
         if confirm:
             if alert_code in self.controller.emergency.alert_config:
                 del self.controller.emergency.alert_config[alert_code]
-            messagebox.showinfo("Deleted", f"Configuration for {alert_code} has been deleted.")
-            self.refresh_config_list()
-            # Also update the alerts page tags if necessary
-            self.controller.frames[EmergencyAlertsPage].update_tree_tags()
+            self.controller.set_status(f"Configuration for {alert_code} has been deleted.")
 
 # ---------------------------
 # Analytics Page
 # ---------------------------
-class AnalyticsPage(tk.Frame):
+class AnalyticsPage(ttk.Frame):
     def __init__(self, parent, controller):
-        super().__init__(parent)
+        super().__init__(parent, style="Page.TFrame")
         self.controller = controller
-        self.configure(background=self.controller.style.bg_color)
         
         # Create main content frame
         content_frame = ttk.Frame(self)
@@ -1335,19 +2102,59 @@ class AnalyticsPage(tk.Frame):
                          style="Header.TLabel")
         title.pack(pady=(0, 20))
         
+        # matplotlib is only imported once this page is first built; pyplot is
+        # skipped entirely since the figure is embedded through FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.ticker import MaxNLocator
+
         # Create matplotlib figure
-        self.fig = plt.Figure(figsize=(10, 6))
+        self.fig = Figure(figsize=(10, 6))
         self.fig.patch.set_facecolor(self.controller.style.bg_color)
         
         # Create subplot
         self.ax = self.fig.add_subplot(111)
         self.ax.set_facecolor('white')
-        self.ax.grid(True, linestyle='--', alpha=0.7)
         self.ax.spines['top'].set_visible(False)
         self.ax.spines['right'].set_visible(False)
         
+        # Customize chart
+        self.ax.set_title('Patient Distribution by Severity Level', 
+                         pad=20, 
+                         fontsize=14, 
+                         fontweight='bold')
+        self.ax.set_xlabel('Severity Level', fontsize=12)
+        self.ax.set_ylabel('Number of Patients', fontsize=12)
+        # Set y-axis to only show integers
+        self.ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        self.ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+        # The bars and their value labels are created once; updates only change their heights and text
+        severities = list(range(1, 11))
+        self.ax.set_xticks(severities)
+        self.bars = self.ax.bar(severities,
+                               [0] * len(severities),
+                               color=self.controller.style.secondary_color,
+                               alpha=0.7,
+                               width=0.6)
+        self.bar_labels = [
+            self.ax.text(bar.get_x() + bar.get_width()/2., 0, '0',
+                         ha='center', va='bottom',
+                         fontsize=10)
+            for bar in self.bars
+        ]
+        # Bars and labels are animated: full draws leave them out of the cached
+        # background, and updates blit just them on top of it
+        self._animated = [*self.bars, *self.bar_labels]
+        for artist in self._animated:
+            artist.set_animated(True)
+        self._background = None
+        self.fig.tight_layout()
+        
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.fig, master=content_frame)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
@@ -1369,64 +2176,65 @@ class AnalyticsPage(tk.Frame):
         self.update_analytics()
 
     def update_analytics(self):
-        # Clear subplot
-        self.ax.clear()
-        
-        # Get severity data
-        severity_data = self.controller.analytics.generate_severity_report()
-        
-        # Create bar chart
-        bars = self.ax.bar(list(severity_data.keys()),
-                          list(severity_data.values()),
-                          color=self.controller.style.secondary_color,
-                          alpha=0.7,
-                          width=0.6)
-        
-        # Customize chart
-        self.ax.set_title('Patient Distribution by Severity Level', 
-                         pad=20, 
-                         fontsize=14, 
-                         fontweight='bold')
-        self.ax.set_xlabel('Severity Level', fontsize=12)
-        self.ax.set_ylabel('Number of Patients', fontsize=12)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            self.ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{int(height)}',
-                        ha='center', va='bottom',
-                        fontsize=10)
-        
-        # Set y-axis to only show integers
-        self.ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
-        
-        # Add grid
-        self.ax.grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Update statistics
-        total = sum(severity_data.values())
-        avg = sum(k * v for k, v in severity_data.items()) / total if total > 0 else 0
-        max_sev = max(severity_data.keys()) if severity_data else 0
-        
-        self.total_patients.config(text=f"Total Patients: {total}")
-        self.avg_severity.config(text=f"Average Severity: {avg:.1f}")
-        self.max_severity.config(text=f"Max Severity: {max_sev}")
-        
-        # Adjust layout
-        self.fig.tight_layout()
-        
-        # Redraw canvas
-        self.canvas.draw()
+        # Bar heights come straight from the analytics counts array (index 0 unused)
+        counts = self.controller.analytics.counts
+        heights = counts[1:].tolist()
+        
+        # Move the existing bars and value labels to the new counts
+        for bar, label, height in zip(self.bars, self.bar_labels, heights):
+            bar.set_height(height)
+            label.set_y(height)
+            label.set_text(f'{height}')
+        # Leave headroom above the tallest bar for its value label
+        top = max(max(heights), 1) * 1.15
+        if self._background is None or top != self.ax.get_ylim()[1]:
+            # The scale changed, so ticks and grid need a full redraw; _on_draw
+            # captures the new background once it has happened
+            self.ax.set_ylim(0, top)
+            self._background = None
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_animated()
+            self.canvas.blit(self.ax.bbox)
+        
+        # Update statistics from the running aggregates
+        analytics = self.controller.analytics
+        self.total_patients.config(text=f"Total Patients: {analytics.total}")
+        self.avg_severity.config(text=f"Average Severity: {analytics.average_severity:.1f}")
+        self.max_severity.config(text=f"Max Severity: {analytics.max_severity}")
+
+    def _on_draw(self, event):
+        # Runs after every full draw, before the canvas reaches the screen
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        # The cached background has the old size; never blit it onto the resized
+        # canvas. The redraw the resize triggers captures a new one.
+        self._background = None
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            self.ax.draw_artist(artist)
 
 # ---------------------------
 # Department Management Page
 # ---------------------------
-class DepartmentManagementPage(tk.Frame):
+_BLACK_FG = ('black_fg',)
+
+def _parse_positive_int(s):
+    """ Returns s as a positive int, or None if it is not one. """
+    try:
+        value = int(s)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+class DepartmentManagementPage(ttk.Frame):
     def __init__(self, parent, controller):
-        super().__init__(parent)
+        super().__init__(parent, style="Page.TFrame")
         self.controller = controller
-        self.configure(background=self.controller.style.bg_color)
         
         # Create main content frame
         content_frame = ttk.Frame(self)
@@ -1482,20 +2290,21 @@ class DepartmentManagementPage(tk.Frame):
         list_frame.pack(fill='both', expand=True)
         
         # Create Treeview
-        self.dept_tree = ttk.Treeview(list_frame,
+        self.dept_tree = VirtualTreeview(list_frame,
                                     columns=('Name', 'Capacity', 'Current'),
-                                    show='headings')
+                                    show='headings',
+                                    style='Dept.Treeview',
+                                    row_tags=_BLACK_FG,
+                                    key_iids=True)
         self.dept_tree.heading('Name', text='Department Name')
         self.dept_tree.heading('Capacity', text='Capacity')
         self.dept_tree.heading('Current', text='Current Patients')
-        self.dept_tree.column('Name', width=150)
-        self.dept_tree.column('Capacity', width=100)
-        self.dept_tree.column('Current', width=100)
-        # Set text color to black for all rows and headings
-        style = ttk.Style()
-        style.configure('Dept.Treeview', foreground='black', font=('Segoe UI', 10))
-        style.configure('Dept.Treeview.Heading', foreground='black', font=('Segoe UI', 10, 'bold'))
-        self.dept_tree.configure(style='Dept.Treeview')
+        # Fixed-width columns: rows never force Tk to recompute column widths
+        self.dept_tree.column('Name', width=150, stretch=False)
+        self.dept_tree.column('Capacity', width=100, stretch=False)
+        self.dept_tree.column('Current', width=100, stretch=False)
+        self.dept_tree['displaycolumns'] = ('Name', 'Capacity', 'Current')
+        # Black text for all rows; Dept.Treeview itself is set up in configure_styles
         self.dept_tree.tag_configure('black_fg', foreground='black')
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.dept_tree.yview)
         self.dept_tree.configure(yscrollcommand=scrollbar.set)
@@ -1521,88 +2330,86 @@ class DepartmentManagementPage(tk.Frame):
                   command=self.delete_department,
                   style="Error.TButton").pack(pady=10)
         
+        self._selected_dept = None  # Name of the selected department, kept by on_dept_select
+        
         # Initial refresh
         self.refresh_departments()
     
     def add_department(self):
         name = self.name_entry.get().strip()
-        capacity = self.capacity_entry.get().strip()
+        capacity = _parse_positive_int(self.capacity_entry.get())
         
-        if not name or not capacity.isdigit():
+        if not name or capacity is None:
             messagebox.showerror("Error", "Please enter valid department name and capacity")
             return
         
         try:
-            self.controller.department_mgr.add_department(name, int(capacity))
-            messagebox.showinfo("Success", f"Department {name} added successfully!")
+            self.controller.department_mgr.add_department(name, capacity)
+            self.controller.set_status(f"Department {name} added successfully!")
             
             # Clear entries
             self.name_entry.delete(0, tk.END)
             self.capacity_entry.delete(0, tk.END)
             
-            self.refresh_departments()
-            # Refresh home page stats
-            self.controller.frames[HomePage].refresh_stats()
+            # The appointment page lists departments too
+            self.controller.schedule_refresh({'departments', 'home_departments', 'appointments'})
         except ValueError as e:
             messagebox.showerror("Error", str(e))
     
     def delete_department(self):
-        selected = self.dept_tree.selection()
-        if not selected:
+        dept_name = self._selected_dept
+        if dept_name is None:
             messagebox.showerror("Error", "Please select a department to delete")
             return
         
-        dept_name = self.dept_tree.item(selected[0])['values'][0]
-        
         confirm = messagebox.askyesno("Confirm Delete",
                                     f"Are you sure you want to delete department {dept_name}?")
         if confirm:
             try:
                 self.controller.department_mgr.delete_department(dept_name)
-                messagebox.showinfo("Success", f"Department {dept_name} deleted successfully!")
-                self.refresh_departments()
-                # Refresh home page stats
-                self.controller.frames[HomePage].refresh_stats()
+                self._set_selected_dept(None)
+                self.controller.set_status(f"Department {dept_name} deleted successfully!")
+                self.controller.schedule_refresh({'departments', 'home_departments', 'appointments'})
             except ValueError as e:
                 messagebox.showerror("Error", str(e))
     
     def refresh_departments(self):
-        # Clear existing items
-        for item in self.dept_tree.get_children():
-            self.dept_tree.delete(item)
-        
-        # Add departments to treeview
+        # The tree only materializes the departments in view
         status = self.controller.department_mgr.get_department_status()
-        for name, info in status.items():
-            self.dept_tree.insert('', 'end', values=(
-                name,
-                info['capacity'],
-                f"{info['current_patients']} ({info['occupancy_rate']:.1f}%)"
-            ), tags=('black_fg',))
+        self.dept_tree.set_rows([
+            (name, (name, info['capacity'], info['current_display']))
+            for name, info in status.items()
+        ])
 
     def on_dept_select(self, event):
-        selected = self.dept_tree.selection()
-        if selected:
-            dept_name = self.dept_tree.item(selected[0])['values'][0]
-            self.selected_dept_var.set(dept_name)
+        # Act on the row the user just clicked; other selected rows may have
+        # scrolled out of view, so only fall back to them when it is deselected
+        selected = [key for key, _ in self.dept_tree.selected_rows()]
+        focused = self.dept_tree.focused_key()
+        if focused in selected:
+            self._set_selected_dept(focused)
         else:
-            self.selected_dept_var.set("")
+            self._set_selected_dept(selected[0] if selected else None)
+
+    def _set_selected_dept(self, dept_name):
+        """Remember the selected department so the action handlers need no Tk lookups."""
+        self._selected_dept = dept_name
+        self.selected_dept_var.set(dept_name or "")
 
     def update_capacity(self):
-        dept_name = self.selected_dept_var.get()
-        new_capacity = self.new_capacity_entry.get().strip()
-        if not dept_name:
+        dept_name = self._selected_dept
+        new_capacity = _parse_positive_int(self.new_capacity_entry.get())
+        if dept_name is None:
             messagebox.showerror("Error", "Please select a department to update.")
             return
-        if not new_capacity.isdigit():
+        if new_capacity is None:
             messagebox.showerror("Error", "Please enter a valid new capacity.")
             return
         try:
-            self.controller.department_mgr.update_department(dept_name, int(new_capacity))
-            messagebox.showinfo("Success", f"Capacity for {dept_name} updated to {new_capacity}.")
+            self.controller.department_mgr.update_department(dept_name, new_capacity)
+            self.controller.set_status(f"Capacity for {dept_name} updated to {new_capacity}.")
             self.new_capacity_entry.delete(0, tk.END)
-            self.refresh_departments()
-            self.controller.frames[HomePage].refresh_stats()
+            self.controller.schedule_refresh({'departments'})
         except ValueError as e:
             messagebox.showerror("Error", str(e))
 